@@ -37,7 +37,7 @@ if __name__ == '__main__':
         bound_file_name2 = "the_same_again_RHS.csv"
         sol_file_name2 = "the_same_again_sol.csv"
 
-        data2 = load_csv(bound_file_name1, sol_file_name1, path)
+        data2 = load_csv(bound_file_name2, sol_file_name2, path)
 
         data1.merge(data2)
 
@@ -0,0 +1,502 @@
+"""
+Module contains a csv parser compiled with numba, used to load very large float tables
+(see dataset.load_csv and dataset.load_csv_single_file).
+
+The file is read as a single byte buffer which is walked by compiled functions. A first
+pass counts the lines and columns to allocate the resulting array once, a second pass
+converts each field into a float and writes it directly into that array.
+
+Only plain float tables are supported: every line must contain the same number of fields,
+separated by a single character delimiter. An optional first line (the header) is returned
+separately as a list of strings.
+
+The conversion of the fields is correctly rounded, the table is equal to the one returned by
+numpy.loadtxt. Most fields are converted by the compiled functions; the few fields for which
+they cannot decide the rounding (more than 19 significant digits, subnormal numbers, values
+lying extremely close to the middle of two floats) are converted afterwards by float.
+"""
+
+import math
+import numpy as np
+from numba import njit
+
+
+NEWLINE = 10
+CARRIAGE_RETURN = 13
+SPACE = 32
+PLUS = 43
+MINUS = 45
+DOT = 46
+ZERO = 48
+NINE = 57
+LOWER_E = 101
+UPPER_E = 69
+NAN = np.frombuffer(b"nan", dtype=np.uint8)
+INF = np.frombuffer(b"inf", dtype=np.uint8)
+INFINITY = np.frombuffer(b"infinity", dtype=np.uint8)
+
+# exact powers of ten, used when both the digits and the power of ten are exact floats
+EXACT_POWERS_OF_TEN = np.array([float("1e%d" % k) for k in range(23)])
+MAX_EXACT_MANTISSA = 2 ** 53
+
+# 128 bits approximations of the powers of five: 5 ** q lies in [P, P + 1) * 2 ** shift,
+# where P = POWERS_OF_FIVE_HIGH[q - SMALLEST_POWER] * 2 ** 64 + POWERS_OF_FIVE_LOW[q - SMALLEST_POWER]
+# and shift = POWERS_OF_FIVE_SHIFT[q - SMALLEST_POWER]. Below 10 ** -343 and above 10 ** 308,
+# every value with at most 19 digits rounds to 0 and infinity respectively.
+SMALLEST_POWER = -343
+LARGEST_POWER = 308
+
+
+def build_powers_of_five():
+    """
+    Returns the tables of the 128 bits approximations of 5 ** q for q in [SMALLEST_POWER, LARGEST_POWER].
+
+    Returns
+    -------
+    high : numpy array of uint64
+        64 most significant bits of the approximations
+    low : numpy array of uint64
+        64 least significant bits of the approximations
+    shift : numpy array of int64
+        power of two by which the approximations have to be multiplied
+    exact : numpy array of bool
+        states whether the approximation is equal to 5 ** q
+    """
+    nb_powers = LARGEST_POWER - SMALLEST_POWER + 1
+    high = np.empty(nb_powers, dtype=np.uint64)
+    low = np.empty(nb_powers, dtype=np.uint64)
+    shift = np.empty(nb_powers, dtype=np.int64)
+    exact = np.empty(nb_powers, dtype=bool)
+    for q in range(SMALLEST_POWER, LARGEST_POWER + 1):
+        if q >= 0:
+            power = 5 ** q
+            k = power.bit_length() - 128
+            approx = power >> k if k > 0 else power << -k
+            is_exact = k <= 0
+        else:
+            power = 5 ** -q
+            k = -(127 + power.bit_length())
+            approx = (1 << -k) // power
+            is_exact = False
+        high[q - SMALLEST_POWER] = approx >> 64
+        low[q - SMALLEST_POWER] = approx & (2 ** 64 - 1)
+        shift[q - SMALLEST_POWER] = k
+        exact[q - SMALLEST_POWER] = is_exact
+    return high, low, shift, exact
+
+
+POWERS_OF_FIVE_HIGH, POWERS_OF_FIVE_LOW, POWERS_OF_FIVE_SHIFT, POWERS_OF_FIVE_EXACT = build_powers_of_five()
+
+U1 = np.uint64(1)
+U10 = np.uint64(10)
+U32 = np.uint64(32)
+U63 = np.uint64(63)
+LOW_32_BITS = np.uint64(2 ** 32 - 1)
+
+
+@njit(cache=True)
+def is_word(buf, start, end, word):
+    """
+    True if buf[start:end] is equal to word, ignoring case.
+
+    Arguments
+    ---------
+    buf : numpy array of uint8
+    start : int
+    end : int
+    word : numpy array of uint8
+        lower case word
+
+    Returns
+    -------
+    is_word : bool
+    """
+    if end - start != len(word):
+        return False
+    for k in range(len(word)):
+        if buf[start + k] | 32 != word[k]:
+            return False
+    return True
+
+
+@njit(cache=True)
+def is_blank(buf, start, end):
+    """
+    True if buf[start:end] only contains spaces and carriage returns.
+
+    Arguments
+    ---------
+    buf : numpy array of uint8
+    start : int
+    end : int
+
+    Returns
+    -------
+    is_blank : bool
+    """
+    for i in range(start, end):
+        if buf[i] != SPACE and buf[i] != CARRIAGE_RETURN:
+            return False
+    return True
+
+
+@njit(cache=True)
+def count_rows(buf):
+    """
+    Returns the number of non blank lines in buf.
+
+    Arguments
+    ---------
+    buf : numpy array of uint8
+
+    Returns
+    -------
+    n_rows : int
+    """
+    n_rows = 0
+    line_start = 0
+    size = len(buf)
+    for i in range(size):
+        if buf[i] == NEWLINE:
+            if not is_blank(buf, line_start, i):
+                n_rows += 1
+            line_start = i + 1
+    if not is_blank(buf, line_start, size):
+        n_rows += 1
+    return n_rows
+
+
+@njit(cache=True)
+def count_cols(buf, delimiter):
+    """
+    Returns the number of fields of the first non blank line in buf.
+
+    Arguments
+    ---------
+    buf : numpy array of uint8
+    delimiter : int
+        byte value of the delimiter
+
+    Returns
+    -------
+    n_cols : int
+    """
+    n_cols = 1
+    line_start = 0
+    for i in range(len(buf)):
+        if buf[i] == NEWLINE:
+            if not is_blank(buf, line_start, i):
+                return n_cols
+            line_start = i + 1
+        elif buf[i] == delimiter:
+            n_cols += 1
+    return n_cols
+
+
+@njit(cache=True)
+def multiply_64(a, b):
+    """
+    Returns the 128 bits product of two uint64 as two uint64 (high, low).
+
+    Arguments
+    ---------
+    a : uint64
+    b : uint64
+
+    Returns
+    -------
+    high : uint64
+    low : uint64
+    """
+    a_low = a & LOW_32_BITS
+    a_high = a >> U32
+    b_low = b & LOW_32_BITS
+    b_high = b >> U32
+    low_low = a_low * b_low
+    low_high = a_low * b_high
+    high_low = a_high * b_low
+    middle = (low_low >> U32) + (low_high & LOW_32_BITS) + (high_low & LOW_32_BITS)
+    low = (low_low & LOW_32_BITS) | (middle << U32)
+    high = a_high * b_high + (low_high >> U32) + (high_low >> U32) + (middle >> U32)
+    return high, low
+
+
+@njit(cache=True)
+def round_to_53_bits(high, rest_is_zero):
+    """
+    Rounds to nearest, ties to even, the number whose 64 most significant bits are high
+    (the most significant one being the bit 63 or 62) to 53 significant bits.
+
+    Arguments
+    ---------
+    high : uint64
+    rest_is_zero : bool
+        states whether all bits of the number below high are zeros
+
+    Returns
+    -------
+    mantissa : uint64
+        in [2 ** 52, 2 ** 53)
+    shift : int
+        the rounded number is mantissa * 2 ** shift, relatively to high
+    """
+    shift = 11 if high >> U63 else 10
+    mantissa = high >> np.uint64(shift)
+    remainder = high & ((U1 << np.uint64(shift)) - U1)
+    half = U1 << np.uint64(shift - 1)
+    if remainder > half or (remainder == half and (not rest_is_zero or mantissa & U1)):
+        mantissa += U1
+        if mantissa >> np.uint64(53):
+            mantissa >>= U1
+            shift += 1
+    return mantissa, shift
+
+
+@njit(cache=True)
+def decimal_to_float(digits, power):
+    """
+    Returns the float closest to digits * 10 ** power.
+
+    The product of digits by the 128 bits approximation of 5 ** power gives the 128 most
+    significant bits of the result up to an error smaller than 2 ** 64. The rounding is
+    accepted when it is the same for both ends of that interval, which fails extremely
+    rarely. Subnormal results are not handled.
+
+    Arguments
+    ---------
+    digits : uint64
+        non zero
+    power : int
+
+    Returns
+    -------
+    val : float
+    is_exact : bool
+        states whether val is the float closest to digits * 10 ** power, when False the
+        number has to be converted by other means
+    """
+    if power < SMALLEST_POWER:
+        return 0.0, True
+    if power > LARGEST_POWER:
+        return np.inf, True
+    if digits <= MAX_EXACT_MANTISSA and -22 <= power <= 22:
+        # both factors are exact floats, a single rounding occurs
+        if power < 0:
+            return float(digits) / EXACT_POWERS_OF_TEN[-power], True
+        return float(digits) * EXACT_POWERS_OF_TEN[power], True
+
+    index = power - SMALLEST_POWER
+    leading_zeros = 0
+    while not (digits << np.uint64(leading_zeros)) >> U63:
+        leading_zeros += 1
+    digits <<= np.uint64(leading_zeros)
+
+    # 192 bits product high * 2 ** 128 + middle * 2 ** 64 + low
+    high, middle = multiply_64(digits, POWERS_OF_FIVE_HIGH[index])
+    carry, low = multiply_64(digits, POWERS_OF_FIVE_LOW[index])
+    middle += carry
+    if middle < carry:
+        high += U1
+    mantissa, shift = round_to_53_bits(high, middle == 0 and low == 0)
+
+    if not POWERS_OF_FIVE_EXACT[index]:
+        # the exact product lies in [product, product + 2 ** 64)
+        upper_middle = middle + U1
+        upper_high = high + U1 if upper_middle == 0 else high
+        if upper_high == 0:
+            return 0.0, False
+        if (mantissa, shift) != round_to_53_bits(upper_high, upper_middle == 0 and low == 0):
+            return 0.0, False
+
+    exponent = 128 + shift - leading_zeros + POWERS_OF_FIVE_SHIFT[index] + power
+    if exponent + 52 < -1022 or exponent + 52 > 1023:
+        return 0.0, False
+    return math.ldexp(float(mantissa), exponent), True
+
+
+@njit(cache=True)
+def atof(buf, start, end):
+    """
+    Converts the characters buf[start:end] into a float.
+
+    Accepts the formats written by the csv module and numpy.savetxt (ex. -12, 0.5, 1e-05,
+    2.500000000000000000e+01, nan, -inf). The result is correctly rounded when is_exact is True
+    (see decimal_to_float), which is always the case for up to 19 significant digits except
+    for subnormal numbers and a few values extremely close to the middle of two floats.
+
+    Arguments
+    ---------
+    buf : numpy array of uint8
+    start : int
+    end : int
+
+    Returns
+    -------
+    val : float
+    is_exact : bool
+        when False, the field has to be converted by float
+    """
+    while start < end and (buf[start] == SPACE or buf[start] == CARRIAGE_RETURN):
+        start += 1
+    while end > start and (buf[end - 1] == SPACE or buf[end - 1] == CARRIAGE_RETURN):
+        end -= 1
+    if start == end:
+        raise ValueError("Empty field in csv file.")
+
+    i = start
+    sign = 1.0
+    if buf[i] == MINUS or buf[i] == PLUS:
+        if buf[i] == MINUS:
+            sign = -1.0
+        i += 1
+    if is_word(buf, i, end, NAN):
+        return np.nan, True
+    if is_word(buf, i, end, INF) or is_word(buf, i, end, INFINITY):
+        return sign * np.inf, True
+
+    mantissa = np.uint64(0)
+    nb_digits = 0
+    exponent = 0
+    seen_digit = False
+    seen_dot = False
+    truncated = False
+    while i < end:
+        c = buf[i]
+        if ZERO <= c <= NINE:
+            seen_digit = True
+            if nb_digits < 19:
+                if mantissa > 0 or c != ZERO:
+                    nb_digits += 1
+                mantissa = mantissa * U10 + np.uint64(c - ZERO)
+                if seen_dot:
+                    exponent -= 1
+            else:
+                truncated = truncated or c != ZERO
+                if not seen_dot:
+                    exponent += 1
+        elif c == DOT and not seen_dot:
+            seen_dot = True
+        else:
+            break
+        i += 1
+    if not seen_digit:
+        raise ValueError("Could not convert field of csv file to float.")
+
+    if i < end and (buf[i] == LOWER_E or buf[i] == UPPER_E):
+        i += 1
+        exp_sign = 1
+        if i < end and (buf[i] == MINUS or buf[i] == PLUS):
+            if buf[i] == MINUS:
+                exp_sign = -1
+            i += 1
+        if i == end:
+            raise ValueError("Could not convert field of csv file to float.")
+        exp_val = 0
+        while i < end and ZERO <= buf[i] <= NINE:
+            exp_val = 10 * exp_val + (buf[i] - ZERO)
+            i += 1
+        exponent += exp_sign * exp_val
+    if i != end:
+        raise ValueError("Could not convert field of csv file to float.")
+
+    if truncated:
+        return 0.0, False
+    if mantissa == 0:
+        return sign * 0.0, True
+    val, is_exact = decimal_to_float(mantissa, exponent)
+    return sign * val, is_exact
+
+
+@njit(cache=True)
+def parse_csv(buf, n_rows, n_cols, delimiter):
+    """
+    Parses the float table stocked in buf into a new array of shape (n_rows, n_cols).
+
+    Blank lines are ignored. The fields that atof cannot convert exactly are left to the caller.
+
+    Arguments
+    ---------
+    buf : numpy array of uint8
+    n_rows : int
+        number of non blank lines in buf (see count_rows)
+    n_cols : int
+        number of fields per line (see count_cols)
+    delimiter : int
+        byte value of the delimiter
+
+    Returns
+    -------
+    table : numpy array (2 dimensional)
+    inexact : (int, int, int, int) list
+        row, column, start and end in buf of the fields that have not been converted
+    """
+    table = np.empty((n_rows, n_cols), dtype=np.float64)
+    inexact = [(0, 0, 0, 0) for _ in range(0)]
+    size = len(buf)
+    row = 0
+    col = 0
+    field_start = 0
+    for i in range(size + 1):
+        c = buf[i] if i < size else NEWLINE
+        if c == delimiter:
+            if col >= n_cols - 1:
+                raise ValueError("Lines of csv file do not have the same number of fields.")
+            table[row, col], is_exact = atof(buf, field_start, i)
+            if not is_exact:
+                inexact.append((row, col, field_start, i))
+            col += 1
+            field_start = i + 1
+        elif c == NEWLINE:
+            if col == 0 and is_blank(buf, field_start, i):
+                field_start = i + 1
+                continue
+            if col != n_cols - 1:
+                raise ValueError("Lines of csv file do not have the same number of fields.")
+            table[row, col], is_exact = atof(buf, field_start, i)
+            if not is_exact:
+                inexact.append((row, col, field_start, i))
+            row += 1
+            col = 0
+            field_start = i + 1
+    return table, inexact
+
+
+def read_float_table(csv_path, delimiter=";", header=True):
+    """
+    Loads the float table stocked in a csv file.
+
+    Arguments
+    ---------
+    csv_path : str
+        path to file
+    delimiter : str
+        single character separating the fields of a line
+    header : bool
+        states whether the first line of the file contains the names of the columns
+
+    Returns
+    -------
+    names : str list or None
+        content of the first line if header is True, None else
+    table : numpy array (2 dimensional)
+    """
+    with open(csv_path, "rb") as file:
+        raw = file.read()
+
+    names = None
+    body_start = 0
+    if header:
+        header_end = raw.find(b"\n")
+        if header_end == -1:
+            header_end = len(raw)
+        names = raw[:header_end].decode().rstrip("\r").split(delimiter)
+        body_start = header_end + 1
+
+    buf = np.frombuffer(raw, dtype=np.uint8)[body_start:]
+    sep = ord(delimiter)
+    n_rows = count_rows(buf)
+    n_cols = count_cols(buf, sep)
+    table, inexact = parse_csv(buf, n_rows, n_cols, sep)
+    for row, col, start, end in inexact:
+        table[row, col] = float(buf[start:end].tobytes())
+    return names, table
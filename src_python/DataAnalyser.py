@@ -1,6 +1,7 @@
 from dataset import *
 from OutputData import *
 import matplotlib.pyplot as plt
+from scipy.stats import variation
 
 """
 The classes of this module contain methods to analyse instances of the different
@@ -19,10 +20,13 @@ class BoundAnalyser:
     Attributes
     ---------
     data : dataset instance
+
+    The RHS are copied in column-major order, so that the values of a single constraint
+    are contiguous in memory.
     """
     def __init__(self, data):
         assert isinstance(data, dataset), "must be applied on dataset instance"
-        self.content = data.get_RHS().copy()
+        self.content = np.array(data.get_RHS(), order='F')
 
     def max(self):
         """
@@ -32,11 +36,7 @@ class BoundAnalyser:
         -------
         lmax : np.array
         """
-        lmax = []
-        (n, p) = self.content.shape
-        for j in range(p):
-            lmax.append(max(self.content[:, j]))
-        return np.array(lmax)
+        return np.max(self.content, axis=0)
 
     def min(self):
         """
@@ -46,11 +46,7 @@ class BoundAnalyser:
         -------
         lmin : np.array
         """
-        lmin = []
-        (n, p) = self.content.shape
-        for j in range(p):
-            lmin.append(min(self.content[:, j]))
-        return np.array(lmin)
+        return np.min(self.content, axis=0)
 
     def range(self):
         """
@@ -124,7 +120,7 @@ class DatasetAnalyser:
     """
     def __init__(self, data):
         assert isinstance(data, dataset), "must be applied on dataset instance"
-        self.bounds = data.get_RHS().copy()
+        self.bounds = np.array(data.get_RHS(), order='F')
         self.solutions = data.get_solutions().copy()
 
     def plot2D_sol_fct_of_RHS(self, save=False, path=None, name=None, clear=True):
@@ -213,7 +209,7 @@ class DataAnalyser:
     def __init__(self, input, output):
         assert isinstance(input, dataset) and isinstance(output, OutputData), "init takes a dataset and" \
                                                                               "an OutputData instance."
-        self.bounds = input.get_RHS().copy()
+        self.bounds = np.array(input.get_RHS(), order='F')
         self.solutions = input.get_solutions().copy()
         self.predictions = output.get_predictions().copy()
         self.analyser_name = output.get_analyser_name()
@@ -2,6 +2,7 @@
 This module contains a class that primarily stocks data.
 """
 
+import csv
 import numpy as np
 import matplotlib.pyplot as plt
 from dataset import solutions
@@ -90,7 +91,6 @@ class OutputData:
             states whether self.RHS and self.solutions are saved in a single file
             or two separate files
         """
-        import csv
         if single_file:
             reshaped_sol = np.reshape(self.get_solutions(), (self.size(), 1))
             reshaped_pre = np.reshape(self.get_predictions(), (self.size(), 1))
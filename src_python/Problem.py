@@ -148,6 +148,14 @@ class Problem:
         matrix of constraints A and rhs b such that constraints of linear optimisation problem can
         written as A * X <= b. Set to None when problem is created and filled by the method
         set_constraints.
+    constraint_names : str list
+        cache of the names of the constraints of the linear optimisation problem. Set to None when problem
+        is created or read from file. Only used with XpressType, which fills it at the first call to
+        get_constraint_names.
+    variable_names : str list
+        cache of the names of the variables of the linear optimisation problem. Set to None when problem
+        is created or read from file. Only used with XpressType, which fills it at the first call to
+        get_variable_names.
     is_simple : bool
         states whether the problem is simple enough that an exhaustive list of the vertices of its
         domain can be computed or not. Will determine which methods will be used by the problem_generator
@@ -162,6 +170,8 @@ class Problem:
         self.mute_solver()
         self.domain = Domain()
         self.constraints = None
+        self.constraint_names = None
+        self.variable_names = None
         self.is_simple = simple_problem
         self.file_name = None
 
@@ -175,6 +185,8 @@ class Problem:
         """
         self.type.read(self, filename)
         self.file_name = filename
+        self.constraint_names = None
+        self.variable_names = None
 
     def get_RHS(self, cons_to_vary=None, all_cons=False):
         """
@@ -264,8 +276,9 @@ class Problem:
 
         Arguments
         ---------
-        rhs : (int, float) list
-            the format required by cplex (IMPORTANT)
+        rhs : (int, float) list or numpy array of shape (N, 2)
+            the format required by cplex (IMPORTANT), or an array whose first column contains
+            the indices of the constraints and the second one their new values
         """
         self.type.set_RHS(self, rhs)
 
@@ -313,6 +326,19 @@ class Problem:
         """Solves the linear optimisation problem."""
         self.type.solve(self)
 
+    def solve_warm(self):
+        """
+        Solves the linear optimisation problem, starting from the basis of the previous solve.
+
+        Useful when the same Problem instance is solved many times with slightly different RHS
+        (set_RHS, solve_warm, get_objective_value, ...), which is much faster than reading the
+        problem from file again for every RHS.
+
+        Presolve is only disabled for this solve: the solver settings are restored afterwards,
+        so later calls to solve behave as before.
+        """
+        self.type.solve_warm(self)
+
     def get_objective_value(self):
         """Returns the solution of the linear optimisation problem (objective value)."""
         return self.type.get_objective_value(self)
@@ -355,6 +381,22 @@ class Problem:
         """
         self.type.var_set_bounds(self, ind, lw_bnd, up_bnd)
 
+    def vars_set_bounds(self, inds, lw_bnds, up_bnds):
+        """
+        Sets the bounds of the variables with indices inds to lw_bnds and up_bnds
+        respectively.
+
+        Arguments
+        ---------
+        inds : int list
+            indices of variables whose bounds should be modified
+        lw_bnds : float list
+            new lower bounds
+        up_bnds : float list
+            new upper bounds
+        """
+        self.type.vars_set_bounds(self, inds, lw_bnds, up_bnds)
+
     def get_status(self):
         """
         Returns the status of the solution.
@@ -365,6 +407,16 @@ class Problem:
         """
         return self.type.get_status(self)
 
+    def get_status_code(self):
+        """
+        Returns the status of the solution as the integer code used by the solver.
+
+        Returns
+        -------
+        status : int
+        """
+        return self.type.get_status_code(self)
+
     def is_feasible(self):
         """
         True if problem is feasible.
@@ -55,8 +55,10 @@ class CplexType(ProblemType):
 
         Arguments
         ---------
-        rhs : (int, float) list
+        rhs : (int, float) list or numpy array of shape (N, 2)
         """
+        if isinstance(rhs, np.ndarray):
+            rhs = list(zip(rhs[:, 0].astype(int).tolist(), rhs[:, 1].tolist()))
         problem.content.linear_constraints.set_rhs(rhs)
 
     def get_constraint_names(self, problem):
@@ -83,6 +85,19 @@ class CplexType(ProblemType):
         """Solves the linear optimisation problem."""
         problem.content.solve()
 
+    def solve_warm(self, problem):
+        """
+        Solves the linear optimisation problem, starting from the basis of the previous solve.
+        Presolve is disabled during the solve and restored afterwards.
+        """
+        presolve = problem.content.parameters.preprocessing.presolve
+        previous = presolve.get()
+        presolve.set(0)
+        try:
+            problem.content.solve()
+        finally:
+            presolve.set(previous)
+
     def get_objective_value(self, problem):
         """Returns the solution of the linear optimisation problem (objective value)."""
         return problem.content.solution.get_objective_value()
@@ -105,13 +120,22 @@ class CplexType(ProblemType):
         problem.content.variables.set_lower_bounds(ind, lw_bnd)
         problem.content.variables.set_upper_bounds(ind, up_bnd)
 
+    def vars_set_bounds(self, problem, inds, lw_bnds, up_bnds):
+        """Sets the bounds of the variables with indices inds to lw_bnds and up_bnds respectively."""
+        problem.content.variables.set_lower_bounds(list(zip(inds, lw_bnds)))
+        problem.content.variables.set_upper_bounds(list(zip(inds, up_bnds)))
+
     def get_status(self, problem):
         """Returns the status of the solution"""
         return problem.content.solution.get_status()
 
+    def get_status_code(self, problem):
+        """Returns the status of the solution as the integer code used by the solver."""
+        return problem.content.solution.get_status()
+
     def is_feasible(self, problem):
         """True if problem is feasible."""
-        if problem.get_status() == 3:
+        if self.get_status_code(problem) == 3:
             return False
         else:
             return True
@@ -129,8 +129,9 @@ class ProblemType:
         Arguments
         ---------
         problem : problem instance
-        rhs : (int, float) list
-            the format required by cplex (IMPORTANT)
+        rhs : (int, float) list or numpy array of shape (N, 2)
+            the format required by cplex (IMPORTANT), or an array whose first column contains
+            the indices of the constraints and the second one their new values
         """
         pass
 
@@ -190,6 +191,18 @@ class ProblemType:
         """
         pass
 
+    def solve_warm(self, problem):
+        """
+        Solves the linear optimisation problem, starting from the basis of the previous solve.
+
+        Meant to be used when the same problem is solved many times with slightly different RHS.
+
+        Arguments
+        ---------
+        problem : problem instance
+        """
+        pass
+
     def get_objective_value(self, problem):
         """
         Returns the solution of the linear optimisation problem (objective value).
@@ -260,6 +273,23 @@ class ProblemType:
         """
         pass
 
+    def vars_set_bounds(self, problem, inds, lw_bnds, up_bnds):
+        """
+        Sets the bounds of the variables with indices inds to lw_bnds and up_bnds
+        respectively.
+
+        Arguments
+        ---------
+        problem : problem instance
+        inds : int list
+            indices of variables whose bounds should be modified
+        lw_bnds : float list
+            new lower bounds
+        up_bnds : float list
+            new upper bounds
+        """
+        pass
+
     def get_status(self, problem):
         """
         Returns the status of the solution.
@@ -274,6 +304,20 @@ class ProblemType:
         """
         pass
 
+    def get_status_code(self, problem):
+        """
+        Returns the status of the solution as the integer code used by the solver.
+
+        Arguments
+        ---------
+        problem : problem instance
+
+        Returns
+        -------
+        status : int
+        """
+        pass
+
     def is_feasible(self, problem):
         """
         True if problem is feasible.
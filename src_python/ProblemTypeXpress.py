@@ -50,12 +50,13 @@ class XpressType(ProblemType):
         """
         rhs = []
         if all_cons:
-            problem.content.getrhs(rhs, 0, self.get_number_vars(problem) - 1)
-        elif cons_to_vary is not None:
-            for elem in cons_to_vary:
-                aux = []
-                problem.content.getrhs(aux, elem, elem)
-                rhs.append(aux[0])
+            problem.content.getrhs(rhs, 0, self.get_number_cons(problem) - 1)
+        elif cons_to_vary is not None and len(cons_to_vary) > 0:
+            # a single call to getrhs on the range covering all indices, instead of one call per index
+            first = min(cons_to_vary)
+            aux = []
+            problem.content.getrhs(aux, first, max(cons_to_vary))
+            rhs = [aux[elem - first] for elem in cons_to_vary]
         return rhs
 
     def get_number_vars(self, problem):
@@ -188,10 +189,14 @@ class XpressType(ProblemType):
         Arguments
         ---------
         problem : problem instance
-        rhs : (int, float) list
-            the format required by cplex (IMPORTANT)
+        rhs : (int, float) list or numpy array of shape (N, 2)
+            the format required by cplex (IMPORTANT), or an array whose first column contains
+            the indices of the constraints and the second one their new values
         """
-        problem.content.chgrhs(mindex=[i[0] for i in rhs], rhs=[i[1] for i in rhs])
+        if isinstance(rhs, np.ndarray):
+            problem.content.chgrhs(mindex=rhs[:, 0].astype(int).tolist(), rhs=rhs[:, 1].tolist())
+        else:
+            problem.content.chgrhs(mindex=[i[0] for i in rhs], rhs=[i[1] for i in rhs])
 
     def get_constraint_names(self, problem, cons_to_vary=None):
         """
@@ -207,20 +212,13 @@ class XpressType(ProblemType):
         -------
         name list : string list
         """
+        if problem.constraint_names is None:
+            problem.constraint_names = [cons.name.strip() for cons in problem.content.getConstraint()]
+
         if cons_to_vary is None:
-            constraints = problem.content.getConstraint()
-            nb_cons = len(constraints)
-            name_list = nb_cons * [None]
-            for i in range(nb_cons):
-                name_list[i] = constraints[i].name.strip()
+            return list(problem.constraint_names)
         else:
-            constraints = problem.content.getConstraint()
-            nb_cons = len(cons_to_vary)
-            name_list = nb_cons * [None]
-            for i in range(nb_cons):
-                name_list[i] = constraints[cons_to_vary[i]].name.strip()
-
-        return name_list
+            return [problem.constraint_names[i] for i in cons_to_vary]
 
     def get_variable(self, problem, ind):
         """
@@ -250,12 +248,9 @@ class XpressType(ProblemType):
         -------
         name list : string list
         """
-        variables = problem.content.getVariable()
-        nb_vars = len(variables)
-        name_list = nb_vars * [None]
-        for i in range(nb_vars):
-            name_list[i] = variables[i].name.strip()
-        return name_list
+        if problem.variable_names is None:
+            problem.variable_names = [var.name.strip() for var in problem.content.getVariable()]
+        return list(problem.variable_names)
 
     def solve(self, problem):
         """
@@ -267,6 +262,26 @@ class XpressType(ProblemType):
         """
         problem.content.solve()
 
+    def solve_warm(self, problem):
+        """
+        Solves the linear optimisation problem, starting from the basis of the previous solve.
+
+        Presolve is disabled during the solve, since it would transform the problem and discard
+        the basis, and restored afterwards. Xpress keeps the optimal basis of a problem after
+        modifying its RHS, so re-solving that basis usually only takes a few iterations when the
+        RHS are small perturbations of each other.
+
+        Arguments
+        ---------
+        problem : problem instance
+        """
+        presolve = problem.content.getControl("presolve")
+        problem.content.setControl("presolve", 0)
+        try:
+            problem.content.solve()
+        finally:
+            problem.content.setControl("presolve", presolve)
+
     def get_objective_value(self, problem):
         """
         Returns the solution of the linear optimisation problem (objective value).
@@ -338,6 +353,25 @@ class XpressType(ProblemType):
         """
         problem.content.chgbounds([ind, ind], ["L", "U"], [lw_bnd, up_bnd])
 
+    def vars_set_bounds(self, problem, inds, lw_bnds, up_bnds):
+        """
+        Sets the bounds of the variables with indices inds to lw_bnds and up_bnds
+        respectively, with a single call to the solver.
+
+        Arguments
+        ---------
+        problem : problem instance
+        inds : int list
+            indices of variables whose bounds should be modified
+        lw_bnds : float list
+            new lower bounds
+        up_bnds : float list
+            new upper bounds
+        """
+        inds = list(inds)
+        nb = len(inds)
+        problem.content.chgbounds(inds + inds, nb * ["L"] + nb * ["U"], list(lw_bnds) + list(up_bnds))
+
     def get_status(self, problem):
         """
         Returns the status of the solution.
@@ -352,6 +386,23 @@ class XpressType(ProblemType):
         """
         return problem.content.getProbStatusString()
 
+    def get_status_code(self, problem):
+        """
+        Returns the status of the solution as the integer code used by the solver.
+
+        Cheaper than get_status, which formats the status into a string.
+
+        Arguments
+        ---------
+        problem : problem instance
+
+        Returns
+        -------
+        status : int
+            compare with the lp status constants of the xpress module (ex. xp.lp_infeas)
+        """
+        return problem.content.attributes.lpstatus
+
     def is_feasible(self, problem):
         """
         True if problem is feasible.
@@ -364,13 +415,17 @@ class XpressType(ProblemType):
         -------
         is_feasible : bool
         """
-        if self.get_status(problem) == "lp_infeas":
-            return False
-        else:
-            return True
+        return self.get_status_code(problem) != xp.lp_infeas
 
 
 class XpressProblemFactory(ProblemFactory):
+    """
+    Creates Problem instances using FICO Xpress.
+
+    Reading a problem from file is much more expensive than solving it. When a problem has to be
+    solved for many RHS, read it once and reuse the same instance: call set_RHS and solve
+    (or solve_warm, which starts from the previous basis) for each RHS.
+    """
 
     def get_problem_instance(self) -> Problem:
         return Problem(prob_type=XpressType())
@@ -6,11 +6,27 @@ by a neural network.
 All classes of this module primarily stock data.
 """
 import os
+import functools
 import pickle
-import matplotlib.pyplot as plt
 import numpy as np
-from scipy.stats import variation
-from sklearn.preprocessing import StandardScaler
+
+
+_rng = np.random.default_rng()
+
+
+def float_format(array):
+    """
+    Returns the format used to write the floats of array in a csv file without loss of precision.
+
+    Arguments
+    ---------
+    array : numpy array
+
+    Returns
+    -------
+    format : str
+    """
+    return "%.9g" if array.dtype == np.float32 else "%.17g"
 
 
 class RHS:
@@ -29,12 +45,10 @@ class RHS:
     content : float list list or numpy array
         a list of truncated RHS fitting some linear optimisation problem
     """
-    def __init__(self, data):
-        """data can be an np.array or a list."""
-        if isinstance(data, np.ndarray):
-            self.content = data
-        elif isinstance(data, list):
-            self.content = np.array(data)
+    def __init__(self, data, dtype=np.float32):
+        """data can be an np.array or a list. It is stocked as an array of type dtype (float32 by default)."""
+        if isinstance(data, (np.ndarray, list)):
+            self.content = np.asarray(data, dtype=dtype)
         else:
             raise Exception("Could not initialise the RHS instance. The data must be list or array.")
 
@@ -42,7 +56,7 @@ class RHS:
         return self.content
 
     def set_RHS(self, new_RHS_list):
-        self.__init__(new_RHS_list)
+        self.content = np.asarray(new_RHS_list, dtype=self.content.dtype)
 
     def size(self):
         """
@@ -68,13 +82,10 @@ class RHS:
             names of constraints that were varied to create the data the network
             was trained on
         """
-        import csv
         full_name = name + ".csv"
         csv_path = os.path.join("." if path is None else path, full_name)
-        with open(csv_path, 'w', newline='') as file_RHS:
-            file_RHS.write(input_names)
-            writer = csv.writer(file_RHS, delimiter=';')
-            writer.writerows(self.content)
+        np.savetxt(csv_path, self.content, fmt=float_format(self.content), delimiter=';',
+                   header=input_names, comments='')
 
 
 class solutions:
@@ -95,12 +106,13 @@ class solutions:
        a list of solutions of some linear optimisation problems that differ only by their
        RHS
     """
-    def __init__(self, data):
-        """data can be a list or an instance of np.array with the solutions"""
-        if isinstance(data, np.ndarray):
-            self.content = data
-        elif isinstance(data, list):
-            self.content = np.array(data)
+    def __init__(self, data, dtype=np.float32):
+        """
+        data can be a list or an instance of np.array with the solutions. It is stocked as
+        an array of type dtype (float32 by default).
+        """
+        if isinstance(data, (np.ndarray, list)):
+            self.content = np.asarray(data, dtype=dtype)
         else:
             raise Exception("could not initialize the solution instance. The data must be list or array")
 
@@ -109,7 +121,7 @@ class solutions:
         return self.content
 
     def set_solutions(self, new_solutions):
-        self.__init__(new_solutions)
+        self.content = np.asarray(new_solutions, dtype=self.content.dtype)
 
     def size(self):
         """
@@ -132,13 +144,9 @@ class solutions:
         path : str
             path to file
         """
-        import csv
         full_name = name + ".csv"
         csv_path = os.path.join("." if path is None else path, full_name)
-        with open(csv_path, 'w', newline='') as file_sol:
-            writer = csv.writer(file_sol, delimiter=';')
-            sol_list = self.content.reshape(-1, 1)
-            writer.writerows(sol_list)
+        np.savetxt(csv_path, self.content.reshape(-1, 1), fmt=float_format(self.content), delimiter=';')
 
 
 class dataset:
@@ -164,10 +172,13 @@ class dataset:
     input_names : str
         names of constraints that were varied to create the data the network
         was trained on
+
+    RHS and solutions are stocked as arrays of type dtype, float32 by default since
+    the data is meant to be fed to a neural network.
     """
-    def __init__(self, RHS_list, solutions_list, input_names=None):
-        self.RHS = RHS(RHS_list)
-        self.solutions = solutions(solutions_list)
+    def __init__(self, RHS_list, solutions_list, input_names=None, dtype=np.float32):
+        self.RHS = RHS(RHS_list, dtype)
+        self.solutions = solutions(solutions_list, dtype)
         s1, s2 = self.solutions.size(), self.RHS.size()
         if s1 != s2:
             print("{} != {}".format(s1, s2))
@@ -219,11 +230,31 @@ class dataset:
         file_name : str
             name of the new file
         """
-        import pickle
         pickle_path = os.path.join("." if path is None else path, file_name)
         set = (self.RHS.get_RHS(), self.solutions.get_solutions())
         pickle.dump(set, open(pickle_path, "wb"))
 
+    def save_npz(self, file_name, path=None):
+        """
+        Saves self.RHS, self.solutions and self.input_names in a numpy .npz file.
+
+        The arrays are written as raw buffers, which is much faster than csv or pickle
+        for large datasets. Use load_npz to load the file into a new dataset instance.
+
+        Arguments
+        ---------
+        file_name : str
+            name of the new file (the extension .npz is added if missing)
+        path : str
+            path to new file
+        """
+        npz_path = os.path.join("." if path is None else path, file_name)
+        if self.input_names is None:
+            np.savez(npz_path, RHS=self.get_RHS(), solutions=self.get_solutions())
+        else:
+            np.savez(npz_path, RHS=self.get_RHS(), solutions=self.get_solutions(),
+                     input_names=np.array(self.input_names, dtype=str))
+
     def to_csv(self, name, path=None, single_file=False):
         """
         Saves content in a single or two distinct files with format csv.
@@ -244,8 +275,6 @@ class dataset:
             states whether self.RHS and self.solutions are saved in a single file
             or two separate files
         """
-        import csv
-
         nb_inputs = len(self.input_names)
         name_str = self.input_names[0]
 
@@ -260,15 +289,12 @@ class dataset:
             content = np.concatenate((self.get_RHS(), reshaped_sol), axis=1)
             full_name = name + ".csv"
             csv_path = os.path.join("." if path is None else path, full_name)
-            with open(csv_path, 'w', newline='') as file_cont:
-                file_cont.write(name_str + "\n")
-                writer = csv.writer(file_cont, delimiter=';')
-                writer.writerows(content)
+            np.savetxt(csv_path, content, fmt=float_format(content), delimiter=';', header=name_str, comments='')
         else:
             self.RHS.save_csv(name + "_RHS", name_str, path)
             self.solutions.save_csv(name + "_sol", path)
 
-    def cut(self, proportion_to_cut):
+    def cut(self, proportion_to_cut, rng=None):
         """
         Cuts a certain proportion of constraints out of self to create a new dataset.
 
@@ -279,6 +305,9 @@ class dataset:
         ---------
         proportion_to_cut : float
             proportion of data to be cut out of self
+        rng : int or numpy.random.Generator
+            seed or generator used to choose the indices, to make the cut reproducible.
+            By default a generator shared by the module is used.
 
         Returns
         -------
@@ -287,23 +316,17 @@ class dataset:
         """
         size = self.size()
         number_to_cut = int(proportion_to_cut * size)
-        index_to_cut = np.random.choice(size, number_to_cut, replace=False)  # We randomly generate the indexes to cut
-        list_to_cut_bool = size * [False]
-        for index in index_to_cut:
-            list_to_cut_bool[index] = True  # list_to_cut_bool[i] is True if line i must be cut
-        RHS_to_keep, solutions_to_keep = [], []
-        RHS_to_cut, solutions_to_cut = [], []
+        # We randomly generate the indexes to cut, without allocating a permutation of all indexes
+        generator = _rng if rng is None else np.random.default_rng(rng)
+        index_to_cut = generator.choice(size, number_to_cut, replace=False, shuffle=False)
+        to_cut = np.zeros(size, dtype=bool)
+        to_cut[index_to_cut] = True  # to_cut[i] is True if line i must be cut
         initial_RHS_array = self.get_RHS()
         initial_solutions_array = self.get_solutions()
-        for i in range(size):
-            if list_to_cut_bool[i]:  # if we cut the line i
-                RHS_to_cut.append(initial_RHS_array[i])
-                solutions_to_cut.append(initial_solutions_array[i])
-            else:
-                RHS_to_keep.append(initial_RHS_array[i])
-                solutions_to_keep.append(initial_solutions_array[i])
-        self.__init__(RHS_to_keep, solutions_to_keep)
-        return dataset(RHS_to_cut, solutions_to_cut)
+        self.RHS.content = initial_RHS_array[~to_cut]
+        self.solutions.content = initial_solutions_array[~to_cut]
+        return dataset(initial_RHS_array[to_cut], initial_solutions_array[to_cut], self.input_names,
+                       initial_RHS_array.dtype)
 
     def merge(self, other_dataset):
         """
@@ -320,19 +343,42 @@ class dataset:
         assert isinstance(other_dataset, dataset), "Argument has to be a dataset instance."
         assert len(other_dataset.get_RHS()[0]) == len(self.get_RHS()[0]), "Bound vectors do not have the same size."
 
-        new_RHS_array = np.concatenate((self.get_RHS(), other_dataset.get_RHS()), axis=0)
-        new_solutions_array = np.concatenate((self.get_solutions(), other_dataset.get_solutions()), axis=0)
-        
-        self.__init__(new_RHS_array, new_solutions_array)
+        RHS_1, RHS_2 = self.get_RHS(), other_dataset.get_RHS()
+        solutions_1, solutions_2 = self.get_solutions(), other_dataset.get_solutions()
+        size_1 = len(RHS_1)
+        size = size_1 + len(RHS_2)
+
+        new_RHS_array = np.empty((size, RHS_1.shape[1]), dtype=RHS_1.dtype)
+        new_RHS_array[:size_1] = RHS_1
+        new_RHS_array[size_1:] = RHS_2
+        new_solutions_array = np.empty(size, dtype=solutions_1.dtype)
+        new_solutions_array[:size_1] = solutions_1
+        new_solutions_array[size_1:] = solutions_2
+
+        self.RHS.content = new_RHS_array
+        self.solutions.content = new_solutions_array
 
     def copy(self):
         """Copies the dataset."""
-        return dataset(np.copy(self.get_RHS()), np.copy(self.get_solutions()))
+        return dataset(np.copy(self.get_RHS()), np.copy(self.get_solutions()), dtype=self.get_RHS().dtype)
 
     def cut_the_first_one(self):
+        """
+        Cuts the first sample out of self and returns it as a new dataset.
+
+        Returns
+        -------
+        dataset : dataset instance
+            instance containing the cut out sample
+        """
         assert self.size() > 0
-        proportion_to_cut = 1 / self.size()
-        return self.cut(proportion_to_cut)
+        initial_RHS_array = self.get_RHS()
+        initial_solutions_array = self.get_solutions()
+        first = dataset(initial_RHS_array[:1].copy(), initial_solutions_array[:1].copy(), self.input_names,
+                        initial_RHS_array.dtype)
+        self.RHS.content = initial_RHS_array[1:]
+        self.solutions.content = initial_solutions_array[1:]
+        return first
 
 
 def load_pickle(file_name, path=None):
@@ -356,7 +402,85 @@ def load_pickle(file_name, path=None):
     return data
 
 
-def load_csv(file_RHS, file_sol, path=None, delimiter=None):
+def load_npz(file_name, path=None):
+    """
+    Loads a .npz file into a dataset instance.
+
+    Should only be used on a file that has previously been saved
+    by the method dataset.save_npz (see save_npz).
+
+    Arguments
+    ---------
+    path : str
+        path to file
+    file_name : str
+        name of file (the extension .npz is added if missing, as done by save_npz)
+    """
+    if not file_name.endswith(".npz"):
+        file_name = file_name + ".npz"
+    npz_path = os.path.join("." if path is None else path, file_name)
+    with np.load(npz_path) as content:
+        input_names = content["input_names"].tolist() if "input_names" in content.files else None
+        return dataset(content["RHS"], content["solutions"], input_names=input_names,
+                       dtype=content["RHS"].dtype)
+
+
+@functools.lru_cache(maxsize=8)
+def read_csv_table(csv_path, mtime_ns, file_size, delimiter=";", header=True, use_numba=False):
+    """
+    Loads the float table stocked in a csv file.
+
+    Results are cached: as long as the file is not modified (its modification time and size
+    are part of the key), loading the same file again does not parse it a second time. The
+    returned array is shared by all calls with the same arguments, it is therefore read-only.
+
+    Arguments
+    ---------
+    csv_path : str
+        absolute path to file
+    mtime_ns : int
+        time of last modification of the file in nanoseconds (see os.stat)
+    file_size : int
+        size of the file in bytes (see os.stat)
+    delimiter : str
+    header : bool
+        states whether the first line of the file contains the names of the columns
+    use_numba : bool
+        states whether the file is parsed by the numba parser in CsvParser.py,
+        which is faster on very large files
+
+    Returns
+    -------
+    names : str tuple or None
+        content of the first line if header is True, None else
+    table : numpy array (2 dimensional)
+    """
+    if use_numba:
+        from CsvParser import read_float_table
+        names, table = read_float_table(csv_path, delimiter, header)
+    else:
+        names = None
+        with open(csv_path, "r") as csv_file:
+            if header:
+                names = csv_file.readline().rstrip("\r\n").split(delimiter)
+            table = np.loadtxt(csv_file, delimiter=delimiter, ndmin=2)
+    table.setflags(write=False)
+    return None if names is None else tuple(names), table
+
+
+def read_csv(file, path=None, delimiter=";", header=True, use_numba=False):
+    """
+    Returns the names and the float table stocked in path/file (see read_csv_table).
+
+    The table is shared with the cache of read_csv_table and is read-only: copy it to modify it.
+    """
+    csv_path = os.path.abspath(os.path.join("." if path is None else path, file))
+    stat = os.stat(csv_path)
+    names, table = read_csv_table(csv_path, stat.st_mtime_ns, stat.st_size, delimiter, header, use_numba)
+    return None if names is None else list(names), table
+
+
+def load_csv(file_RHS, file_sol, path=None, delimiter=None, use_numba=False, dtype=np.float32):
     """
     Loads the content of two csv files into a dataset instance.
 
@@ -364,6 +488,9 @@ def load_csv(file_RHS, file_sol, path=None, delimiter=None):
     RHS, the second one a list of solutions. Both files should be saved in the
     same directory.
 
+    Files that have already been loaded and have not been modified since are
+    not parsed again (see read_csv_table).
+
     Arguments
     ---------
     path : str
@@ -372,62 +499,46 @@ def load_csv(file_RHS, file_sol, path=None, delimiter=None):
         name of file containing a RHS list
     file_sol : str
         name of file containing a list of solutions
+    use_numba : bool
+        states whether the files are parsed by the numba parser in CsvParser.py,
+        which is faster on very large files
+    dtype : numpy dtype
+        type of the arrays of the new dataset (see class dataset)
     """
-    import csv
     if delimiter is None:
         delimiter = ";"
-    RHS_list = []
-    solutions = []
-    csv_path = os.path.join("." if path is None else path, file_RHS)
-    with open(csv_path, "r") as csv_RHS:
-        reader = csv.reader(csv_RHS, delimiter=delimiter)
-        first = True
-        for row in reader:
-            if first:
-                input_names = row
-                first = False
-            else:
-                RHS_list.append([float(e) for e in row])
-    sol_path = os.path.join("." if path is None else path, file_sol)
-    with open(sol_path, "r") as csv_sol:
-        reader = csv.reader(csv_sol, delimiter=delimiter)
-        for row in reader:
-            solutions.append(float(row[0]))
-    return dataset(RHS_list, solutions, input_names=input_names)
-
-
-def load_csv_single_file(file, path=None, delimiter=None):
+    input_names, RHS_table = read_csv(file_RHS, path, delimiter, True, use_numba)
+    solutions_table = read_csv(file_sol, path, delimiter, False, use_numba)[1]
+    # np.array copies, so the dataset does not share its content with the cache
+    return dataset(np.array(RHS_table, dtype=dtype), np.array(solutions_table[:, 0], dtype=dtype),
+                   input_names=input_names, dtype=dtype)
+
+
+def load_csv_single_file(file, path=None, delimiter=None, use_numba=False, dtype=np.float32):
     """
     Loads the content of a csv file into a dataset instance.
 
     The file should contain a float table. The last column of that table
     should contain the solution vector.
 
+    Files that have already been loaded and have not been modified since are
+    not parsed again (see read_csv_table).
+
     Arguments
     ---------
     path : str
         path to file
     file : str
         name of file
+    use_numba : bool
+        states whether the file is parsed by the numba parser in CsvParser.py,
+        which is faster on very large files
+    dtype : numpy dtype
+        type of the arrays of the new dataset (see class dataset)
     """
-    import csv
     if delimiter is None:
         delimiter = ";"
-    content = []
-    csv_path = os.path.join("." if path is None else path, file)
-    with open(csv_path, "r") as csv_RHS:
-        reader = csv.reader(csv_RHS, delimiter=delimiter)
-        first = True
-        for row in reader:
-            if first:
-                input_names = row
-                first = False
-            else:
-                content.append([float(e) for e in row])
-    nb = len(content)
-    RHS_list = nb * [None]
-    solutions = nb * [None]
-    for i in range(nb):
-        RHS_list[i] = content[i][:-1]
-        solutions[i] = content[i][-1]
-    return dataset(RHS_list, solutions, input_names=input_names)
+    input_names, content = read_csv(file, path, delimiter, True, use_numba)
+    # np.array copies, so the dataset does not share its content with the cache
+    return dataset(np.array(content[:, :-1], dtype=dtype), np.array(content[:, -1], dtype=dtype),
+                   input_names=input_names, dtype=dtype)
@@ -23,6 +23,7 @@ from GenerationMode import GenerationModeClassic, GenerationMode, \
 from MathFunctions import get_weights_for_convex_comb, convex_comb
 import random
 from time import time
+from concurrent.futures import ProcessPoolExecutor
 
 
 class lin_opt_pbs:
@@ -43,8 +44,10 @@ class lin_opt_pbs:
         a list of RHS in the format used by most lp solvers.
         The first elements of the tuples represent indices of constraints, so they should
         all be different and never exceed the number of constraints of self.problem.
-    generated_RHS : ((int, float) list, (int, float) list) list
-        a list of newly created RHS in a particular format.
+    generated_RHS : ((int, float) list or numpy array, (int, float) list) list
+        a list of newly created RHS in a particular format. The constraint part of each RHS is
+        either a list of tuples (index, value) or an array of shape (N, 2) with the indices in
+        its first column and the values in its second one (see Problem.set_RHS).
     dev : float
         giving the RELATIVE deviation of the noise when generating new problems with some generation modes.
     cons_to_vary : int list
@@ -109,7 +112,8 @@ class lin_opt_pbs:
 
         Arguments
         ---------
-        RHS : [(int, float) list, (int, float) list]
+        RHS : [(int, float) list or numpy array of shape (N, 2), (int, float) list]
+            constraints in any format taken by Problem.set_RHS, then variables to fix
 
         Return
         ------
@@ -182,8 +186,8 @@ class lin_opt_pbs:
 
         Return
         ------
-        RHS : [(int, float) list, (int, float) list]
-            the generated RHS
+        RHS : [(int, float) list or numpy array of shape (N, 2), (int, float) list]
+            the generated RHS (the format of the constraints depends on self.generation_mode)
         """
         new_rhs = self.generation_mode.choose_constraints_random(self, k)
         values = self.generation_mode.choose_vars_random(self)
@@ -392,20 +396,15 @@ class lin_opt_pbs:
 
         Return
         ------
-        rhs : (int, float) list
-           the indices of the fixed constraints and their new values.
+        rhs : numpy array of shape (N, 2)
+           the indices of the fixed constraints (first column) and their new values (second column).
         """
         if self.cons_to_vary is None:
-            return []
+            return np.empty((0, 2))
         else:
-            rhs = self.RHS_list[k]
-            nb = len(rhs)
-            new_rhs = nb * [None]
-            for i in range(nb):
-                val = rhs[i][1]
-                new_val = val + (np.random.normal(0, abs(val) * self.dev, 1))[0]  # add gaussian noise to the RHS
-                new_rhs[i] = (rhs[i][0], new_val)
-        return new_rhs
+            rhs = np.array(self.RHS_list[k], dtype=float).reshape(-1, 2)
+            rhs[:, 1] += np.random.normal(0, np.abs(rhs[:, 1]) * self.dev)  # add gaussian noise to the RHS
+        return rhs
 
     def choose_constraints_random_continuous(self):
         """
@@ -446,9 +445,10 @@ class lin_opt_pbs:
             variable of the linear optimisation problem and the float the value it
             should be set to.
         """
-        nb = len(values)
-        for i in range(nb):
-            self.problem.var_set_bounds(values[i][0], values[i][1], values[i][1])
+        if len(values) > 0:
+            inds = [value[0] for value in values]
+            vals = [value[1] for value in values]
+            self.problem.vars_set_bounds(inds, vals, vals)
 
     def compute_random_vertices_of_master(self, nb):
         """
@@ -555,6 +555,79 @@ def give_name(N, dev, cons_to_vary=None, vars_to_vary=None):
     return name
 
 
+_worker_problem = None
+
+
+def _init_worker(factory, file_name):
+    """
+    Initializer of the worker processes of solve_many. Reads the problem once per process.
+
+    Arguments
+    ---------
+    factory : ProblemFactory instance
+    file_name : str
+        path to the file containing the linear optimisation problem
+    """
+    global _worker_problem
+    _worker_problem = factory.read_problem_from_file(file_name)
+
+
+def _solve_rhs(rhs):
+    """
+    Solves the problem of the current worker process with the given RHS (see solve_many).
+
+    Arguments
+    ---------
+    rhs : (int, float) list or numpy array of shape (N, 2)
+        see Problem.set_RHS
+
+    Returns
+    -------
+    solution : float
+        objective value of the linear optimisation problem, None if it is infeasible
+    is_feasible : bool
+    """
+    _worker_problem.set_RHS(rhs)
+    _worker_problem.solve_warm()
+    if not _worker_problem.is_feasible():
+        return None, False
+    return _worker_problem.get_objective_value(), True
+
+
+def solve_many(file_name, rhs_list, factory: ProblemFactory, workers=None):
+    """
+    Solves the linear optimisation problem stocked in a file for each RHS of rhs_list,
+    spreading the solves over several processes.
+
+    The solves are independent, so each worker process reads the problem once and then
+    only changes its RHS between two solves, starting each solve from the previous basis
+    (see Problem.solve_warm). Processes are used instead of threads since
+    the marshalling of the data between python and the solver holds the GIL.
+
+    Arguments
+    ---------
+    file_name : str
+        path to the file containing the linear optimisation problem
+    rhs_list : list of (int, float) list or numpy array of shape (N, 2)
+        RHS to be solved, in the format taken by Problem.set_RHS
+    factory : ProblemFactory instance
+        choose the problem factory that matches the lp solver you are using
+    workers : int
+        number of processes, by default (None or 0) the number of processors of the machine
+
+    Returns
+    -------
+    results : (float, bool) list
+        objective value and feasibility of the problem for each RHS, in the order of rhs_list.
+        The objective value is None for infeasible RHS.
+    """
+    nb_workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(rhs_list) // (4 * nb_workers))
+    with ProcessPoolExecutor(max_workers=nb_workers, initializer=_init_worker,
+                             initargs=(factory, file_name)) as executor:
+        return list(executor.map(_solve_rhs, rhs_list, chunksize=chunksize))
+
+
 def problem_generator(N, dev, mode: GenerationMode, factory: ProblemFactory, save=False, single_file=False,
                       find_path=None, save_path=None, name=None):
     """
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+from CsvParser import read_float_table
+from dataset import dataset, load_csv, load_csv_single_file
+
+
+@pytest.mark.parametrize("use_numba", [False, True])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_to_csv_round_trip(tmp_path, use_numba, dtype):
+    rng = np.random.default_rng(0)
+    rhs = rng.standard_normal((50, 3)) * 10.0 ** rng.integers(-8, 8, (50, 3))
+    data = dataset(rhs, rng.standard_normal(50), input_names=["a", "b", "c"], dtype=dtype)
+    data.to_csv("single", str(tmp_path), single_file=True)
+    data.to_csv("two", str(tmp_path))
+
+    single = load_csv_single_file("single.csv", str(tmp_path), use_numba=use_numba)
+    two = load_csv("two_RHS.csv", "two_sol.csv", str(tmp_path), use_numba=use_numba)
+    for loaded in (single, two):
+        assert loaded.input_names == ["a", "b", "c"]
+        assert np.array_equal(loaded.get_RHS(), data.get_RHS().astype(np.float32))
+        assert np.array_equal(loaded.get_solutions(), data.get_solutions().astype(np.float32))
+
+
+@pytest.mark.parametrize("fmt", ["%.17g", "%.9g", "%.25g"])
+def test_correctly_rounded(tmp_path, fmt):
+    rng = np.random.default_rng(0)
+    table = rng.standard_normal((2000, 4)) * 10.0 ** rng.integers(-8, 8, (2000, 4))
+    table[1000:] *= 10.0 ** rng.integers(-300, 300, (1000, 4))
+    csv_path = str(tmp_path / "digits.csv")
+    np.savetxt(csv_path, table, fmt=fmt, delimiter=";", header="a;b;c;d", comments="")
+    names, parsed = read_float_table(csv_path)
+    assert names == ["a", "b", "c", "d"]
+    assert np.array_equal(parsed, np.loadtxt(csv_path, delimiter=";", skiprows=1))
+
+
+def test_hard_cases(tmp_path):
+    # ties, subnormals, bounds of the float range and more than 19 significant digits
+    fields = ["9007199254740993", "9007199254740995", "1e23", "2.2250738585072011e-308",
+              "4.9406564584124654e-324", "2.4703282292062328e-324", "2.4703282292062327e-324",
+              "1.7976931348623157e308", "1.7976931348623159e308", "1e-400", "1e400",
+              "1.00000000000000011102230246251565404", "123456789012345678901234567890"]
+    csv_path = tmp_path / "hard.csv"
+    csv_path.write_text("a\n" + "\n".join(fields))
+    names, parsed = read_float_table(str(csv_path))
+    assert parsed[:, 0].tolist() == [float(field) for field in fields]
+
+
+def test_nan_and_inf(tmp_path):
+    table = np.array([[np.nan, np.inf], [-np.inf, 1.5]])
+    csv_path = str(tmp_path / "special.csv")
+    np.savetxt(csv_path, table, fmt="%.17g", delimiter=";", header="a;b", comments="")
+    names, parsed = read_float_table(csv_path)
+    assert np.array_equal(parsed, np.loadtxt(csv_path, delimiter=";", skiprows=1), equal_nan=True)
+
+
+def test_crlf_and_blank_lines(tmp_path):
+    csv_path = tmp_path / "crlf.csv"
+    csv_path.write_bytes(b"a;b\r\n1;-2.5\r\n\r\n3;4e2\r\n\n")
+    names, parsed = read_float_table(str(csv_path))
+    assert names == ["a", "b"]
+    assert np.array_equal(parsed, [[1, -2.5], [3, 400]])
+
+
+def test_no_header(tmp_path):
+    csv_path = tmp_path / "sol.csv"
+    csv_path.write_bytes(b"5\n6")
+    names, parsed = read_float_table(str(csv_path), header=False)
+    assert names is None
+    assert np.array_equal(parsed, [[5], [6]])
+
+
+@pytest.mark.parametrize("content", [b"a;b\n1;2\n3\n", b"a;b\n1;2\n3;4;5\n"])
+def test_ragged_rows_raise(tmp_path, content):
+    csv_path = tmp_path / "ragged.csv"
+    csv_path.write_bytes(content)
+    with pytest.raises(ValueError):
+        read_float_table(str(csv_path))
+
+
+def test_invalid_field_raises(tmp_path):
+    csv_path = tmp_path / "invalid.csv"
+    csv_path.write_bytes(b"a;b\n1;x\n")
+    with pytest.raises(ValueError):
+        read_float_table(str(csv_path))
+
+
+@pytest.mark.filterwarnings("ignore:loadtxt")
+@pytest.mark.parametrize("use_numba", [False, True])
+def test_empty_body(tmp_path, use_numba):
+    (tmp_path / "empty.csv").write_bytes(b"a;b\n")
+    data = load_csv_single_file("empty.csv", str(tmp_path), use_numba=use_numba)
+    assert data.size() == 0
+    assert data.input_names == ["a", "b"]
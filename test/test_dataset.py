@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+from dataset import dataset, load_npz, load_csv, load_csv_single_file, read_csv, read_csv_table
+
+
+@pytest.mark.parametrize("input_names", [None, ["a", "b"]])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("file_name", ["data", "data.npz"])
+def test_npz_round_trip(tmp_path, input_names, dtype, file_name):
+    data = dataset(np.random.rand(10, 2), np.random.rand(10), input_names=input_names, dtype=dtype)
+    data.save_npz(file_name, str(tmp_path))
+    assert (tmp_path / "data.npz").exists()
+
+    for name in ("data", "data.npz"):
+        loaded = load_npz(name, str(tmp_path))
+        assert loaded.input_names == input_names
+        assert loaded.get_RHS().dtype == dtype and loaded.get_solutions().dtype == dtype
+        assert np.array_equal(loaded.get_RHS(), data.get_RHS())
+        assert np.array_equal(loaded.get_solutions(), data.get_solutions())
+
+
+def test_csv_cache(tmp_path):
+    data = dataset(np.random.rand(10, 2), np.random.rand(10), input_names=["a", "b"], dtype=np.float64)
+    data.to_csv("cached", str(tmp_path), single_file=True)
+    read_csv_table.cache_clear()
+
+    first = load_csv_single_file("cached.csv", str(tmp_path), dtype=np.float64)
+    second = load_csv_single_file("cached.csv", str(tmp_path), dtype=np.float64)
+    assert read_csv_table.cache_info().hits == 1
+    assert np.array_equal(first.get_RHS(), data.get_RHS())
+    assert first.get_RHS().dtype == np.float64
+
+    # callers get independent copies
+    first.get_RHS()[0, 0] = -1
+    first.get_solutions()[0] = -1
+    third = load_csv_single_file("cached.csv", str(tmp_path), dtype=np.float64)
+    assert np.array_equal(third.get_RHS(), data.get_RHS())
+    assert np.array_equal(third.get_solutions(), data.get_solutions())
+    assert not np.shares_memory(second.get_RHS(), third.get_RHS())
+
+    # rewriting the file invalidates the cache
+    new_data = dataset(np.random.rand(12, 2), np.random.rand(12), input_names=["a", "b"], dtype=np.float64)
+    new_data.to_csv("cached", str(tmp_path), single_file=True)
+    reloaded = load_csv_single_file("cached.csv", str(tmp_path), dtype=np.float64)
+    assert np.array_equal(reloaded.get_RHS(), new_data.get_RHS())
+
+
+@pytest.mark.parametrize("use_numba", [False, True])
+def test_read_csv_table_is_read_only(tmp_path, use_numba):
+    data = dataset(np.random.rand(10, 2), np.random.rand(10), input_names=["a", "b"])
+    data.to_csv("shared", str(tmp_path), single_file=True)
+    _, table = read_csv("shared.csv", str(tmp_path), use_numba=use_numba)
+    with pytest.raises(ValueError):
+        table[:] = -7
+    assert not np.any(load_csv_single_file("shared.csv", str(tmp_path), use_numba=use_numba).get_RHS() == -7)
+
+
+def test_load_csv_dtype(tmp_path):
+    data = dataset(np.random.rand(10, 2), np.random.rand(10), input_names=["a", "b"], dtype=np.float64)
+    data.to_csv("two", str(tmp_path))
+    loaded = load_csv("two_RHS.csv", "two_sol.csv", str(tmp_path), dtype=np.float64)
+    assert loaded.get_RHS().dtype == np.float64 and loaded.get_solutions().dtype == np.float64
+    assert np.array_equal(loaded.get_solutions(), data.get_solutions())
+    assert load_csv("two_RHS.csv", "two_sol.csv", str(tmp_path)).get_RHS().dtype == np.float32
+
+
+def test_cut_the_first_one():
+    data = dataset(np.arange(10.).reshape(5, 2), np.arange(5.), input_names=["a", "b"], dtype=np.float64)
+    first = data.cut_the_first_one()
+    assert np.array_equal(first.get_RHS(), [[0, 1]])
+    assert np.array_equal(first.get_solutions(), [0])
+    assert data.size() == 4
+    assert np.array_equal(data.get_RHS(), np.arange(2., 10.).reshape(4, 2))
+    assert np.array_equal(data.get_solutions(), [1, 2, 3, 4])
+    for result in (first, data):
+        assert result.input_names == ["a", "b"]
+        assert result.get_RHS().dtype == np.float64 and result.get_solutions().dtype == np.float64
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_cut(dtype):
+    rhs = np.arange(40.).reshape(20, 2)
+    data = dataset(rhs, np.arange(20.), input_names=["a", "b"], dtype=dtype)
+    cut = data.cut(0.3)
+    assert cut.size() == 6 and data.size() == 14
+
+    kept_ind = data.get_solutions().astype(int)
+    cut_ind = cut.get_solutions().astype(int)
+    assert np.all(np.diff(kept_ind) > 0) and np.all(np.diff(cut_ind) > 0)
+    assert np.array_equal(np.sort(np.concatenate((kept_ind, cut_ind))), np.arange(20))
+    assert np.array_equal(data.get_RHS(), rhs[kept_ind])
+    assert np.array_equal(cut.get_RHS(), rhs[cut_ind])
+    for result in (data, cut):
+        assert result.input_names == ["a", "b"]
+        assert result.get_RHS().dtype == dtype and result.get_solutions().dtype == dtype
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_merge(dtype):
+    data = dataset(np.arange(6.).reshape(3, 2), np.arange(3.), input_names=["a", "b"], dtype=dtype)
+    other = dataset(np.arange(6., 10.).reshape(2, 2), np.arange(3., 5.))
+    data.merge(other)
+    assert np.array_equal(data.get_RHS(), np.arange(10.).reshape(5, 2))
+    assert np.array_equal(data.get_solutions(), np.arange(5.))
+    assert data.get_RHS().dtype == dtype and data.get_solutions().dtype == dtype
+    assert data.input_names == ["a", "b"]
+    assert other.size() == 2
+
+
+def test_cut_is_reproducible_with_seed():
+    cuts = []
+    for rng in (3, 3, np.random.default_rng(3)):
+        data = dataset(np.arange(200.).reshape(100, 2), np.arange(100.))
+        cuts.append(data.cut(0.2, rng=rng).get_solutions())
+    assert np.array_equal(cuts[0], cuts[1]) and np.array_equal(cuts[0], cuts[2])
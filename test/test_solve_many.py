@@ -0,0 +1,46 @@
+import os
+import pytest
+from problem_generator import solve_many
+
+
+class FakeProblem:
+    """Problem whose objective value is the sum of its RHS, infeasible when that sum is negative."""
+    def __init__(self):
+        self.rhs = None
+        self.solved = False
+
+    def set_RHS(self, rhs):
+        self.rhs = rhs
+        self.solved = False
+
+    def solve_warm(self):
+        self.solved = True
+
+    def is_feasible(self):
+        return sum(value for _, value in self.rhs) >= 0
+
+    def get_objective_value(self):
+        # like cplex, fails when the problem has no solution
+        assert self.solved and self.is_feasible(), "no solution exists"
+        return sum(value for _, value in self.rhs)
+
+
+class FakeFactory:
+    def read_problem_from_file(self, filename, simple_problem=False):
+        return FakeProblem()
+
+
+def test_solve_many_keeps_order_and_skips_infeasible():
+    rhs_list = [[(0, 1.0), (1, 2.0)], [(0, -5.0)], [(0, 4.0)], [(1, -1.0), (2, 0.5)], [(0, 0.0)]]
+    results = solve_many("fake.lp", rhs_list, FakeFactory(), workers=2)
+    assert results == [(3.0, True), (None, False), (4.0, True), (None, False), (0.0, True)]
+
+
+def test_solve_many_without_cpu_count(monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: None)
+    assert solve_many("fake.lp", [[(0, 1.0)], [(0, 2.0)]], FakeFactory()) == [(1.0, True), (2.0, True)]
+
+
+def test_solve_many_invalid_workers():
+    with pytest.raises(ValueError):
+        solve_many("fake.lp", [[(0, 1.0)]], FakeFactory(), workers=-1)